@@ -6,6 +6,7 @@ from .models import (
     AccountStatus, BalanceException, SecurityException
 )
 from .ai_services import AIServices
+from .cli import BankAccountCLI
 
 __all__ = [
     'BankAccount',
@@ -15,5 +16,6 @@ __all__ = [
     'AccountStatus',
     'BalanceException',
     'SecurityException',
-    'AIServices'
+    'AIServices',
+    'BankAccountCLI'
 ]
@@ -2,13 +2,19 @@
 from __future__ import annotations
 from datetime import datetime
 import hashlib
+import itertools
 import json
-from typing import List, Dict, Optional, Any, Tuple, ClassVar
+import struct
+import time
+import weakref
+from typing import List, Dict, Optional, Any, Tuple, ClassVar, Iterable, Iterator
 
-from .utils import logger, transaction_context, transaction_logger, generate_id
+from .utils import (
+    logger, transaction_context, transaction_logger, generate_id, VERBOSE_UI, ensure_utf8_stdout
+)
 from .models import (
     Transaction, TransactionType, TransactionResult, AccountStatus, 
-    BalanceException, BankingInterface
+    BalanceException, BankingInterface, LoanRecord
 )
 from .security import SecurityManager
 from .loan import LoanManager
@@ -16,39 +22,146 @@ from .account_linking import AccountLinking
 from .ai_services import AIServices
 
 
+# Binary snapshot layout (little-endian). Strings are length-prefixed UTF-8.
+_BINARY_VERSION = 1
+_ACCOUNT_HEADER = struct.Struct('<BqqdiiddIII')
+_TRANSACTION_RECORD = struct.Struct('<Bd')
+_LOAN_RECORD = struct.Struct('<dd')
+_STRING_LENGTH = struct.Struct('<I')
+_TRANSACTION_TYPES: Tuple[TransactionType, ...] = tuple(TransactionType)
+_TRANSACTION_TYPE_CODES: Dict[TransactionType, int] = {t: i for i, t in enumerate(_TRANSACTION_TYPES)}
+
+
+def _pack_str(parts: List[bytes], value: str) -> None:
+    """Append a length-prefixed UTF-8 string to a list of byte chunks."""
+    encoded = value.encode()
+    parts.append(_STRING_LENGTH.pack(len(encoded)))
+    parts.append(encoded)
+
+
+def _unpack_str(buffer: memoryview, offset: int) -> Tuple[str, int]:
+    """Read a length-prefixed UTF-8 string, returning it with the next offset."""
+    (length,) = _STRING_LENGTH.unpack_from(buffer, offset)
+    offset += _STRING_LENGTH.size
+    return str(buffer[offset:offset + length], 'utf-8'), offset + length
+
+
 class BankAccount(BankingInterface):
     """Main bank account class."""
     
-    # Class variable tracking all accounts
-    _all_accounts: ClassVar[Dict[str, 'BankAccount']] = {}
+    # Fixed attribute layout; __weakref__ keeps accounts usable in the registry
+    __slots__ = (
+        '_balance_cents', '_savings_cents', 'name', 'transactions',
+        '_auto_savings_bp', 'creditLimit', 'credit_score',
+        'account_id', 'provider', 'status', 'last_transaction_time',
+        '_loan_manager', '_account_linking', '_security', '_context_snapshots',
+        '__weakref__'
+    )
+    
+    # Class variable tracking all live accounts; weak references let
+    # unreferenced accounts be garbage collected
+    _all_accounts: ClassVar[weakref.WeakValueDictionary[str, 'BankAccount']] = weakref.WeakValueDictionary()
+    
+    # When set, transaction_context skips per-transaction IDs and logging
+    _single_threaded_mode: ClassVar[bool] = False
     
-    def __init__(self, initialAmount: float, acctName: str, creditLimit: float = 200):
-        """Initialize a new bank account."""
+    def __init__(self, initialAmount: float, acctName: str, creditLimit: float = 200,
+                 provider: str = "Default", linked: Optional[Iterable['BankAccount']] = None,
+                 _register: bool = True):
+        """
+        Initialize a new bank account.
+        
+        Args:
+            initialAmount: Opening balance
+            acctName: Account name
+            creditLimit: Overdraft allowed below zero
+            provider: Bank provider (PalmPay, MoneyPoint, etc.)
+            linked: External accounts to link immediately, in one batch
+            _register: Whether to add the account to the class registry; internal
+                results of operator overloads are not registered
+        """
         if initialAmount < 0:
             raise ValueError("❌ Error: Initial balance cannot be negative.")
             
-        self.balance = initialAmount
-        self.savings = 0
+        # Money is held as integer cents; balance/savings are dollar views
+        self._balance_cents = round(initialAmount * 100)
+        self._savings_cents = 0
         self.name = acctName
         self.transactions: List[Transaction] = []
-        self.autoSavingsPercentage = 5  # Default auto-savings
+        self._auto_savings_bp = 500  # Default auto-savings (5%) in basis points
         self.creditLimit = creditLimit
         self.credit_score = 500
         self.account_id = self._generate_account_id(acctName, initialAmount)
-        self.provider = "Default"  # Bank provider (PalmPay, MoneyPoint, etc.)
+        self.provider = provider
         self.status = AccountStatus.ACTIVE
         self.last_transaction_time = datetime.now()  
         
-        # Initialize component objects - composition pattern
-        self.loan_manager = LoanManager(self)
-        self.account_linking = AccountLinking(self)
-        self.security = SecurityManager(self)
+        # Component objects - composition pattern, created on first access
+        self._loan_manager: Optional[LoanManager] = None
+        self._account_linking: Optional[AccountLinking] = None
+        self._security: Optional[SecurityManager] = None
+        
+        # State captured by __enter__ for rollback in __exit__; a stack so
+        # nested with-blocks each restore their own entry point
+        self._context_snapshots: List[tuple] = []
         
         # Register this account in the class registry
-        BankAccount._all_accounts[self.account_id] = self
+        if _register:
+            BankAccount._all_accounts[self.account_id] = self
         
-        logger.info(f"Account created: {acctName} (ID: {self.account_id}) with ${initialAmount:.2f}")
-        print(f"✅ Account '{self.name}' created with balance: ${self.balance:.2f}\n")
+        logger.info("Account created: %s (ID: %s) with $%.2f", acctName, self.account_id, initialAmount)
+        
+        if linked:
+            self.account_linking.link_accounts(linked)
+    
+    @property
+    def loan_manager(self) -> LoanManager:
+        """Loan manager for this account, created on first use."""
+        if self._loan_manager is None:
+            self._loan_manager = LoanManager(self)
+        return self._loan_manager
+    
+    @property
+    def account_linking(self) -> AccountLinking:
+        """Account linking manager for this account, created on first use."""
+        if self._account_linking is None:
+            self._account_linking = AccountLinking(self)
+        return self._account_linking
+    
+    @property
+    def security(self) -> SecurityManager:
+        """Security manager for this account, created on first use."""
+        if self._security is None:
+            self._security = SecurityManager(self)
+        return self._security
+    
+    @property
+    def balance(self) -> float:
+        """Available balance in dollars."""
+        return self._balance_cents / 100
+    
+    @balance.setter
+    def balance(self, value: float) -> None:
+        self._balance_cents = round(value * 100)
+    
+    @property
+    def savings(self) -> float:
+        """Auto-saved amount in dollars."""
+        return self._savings_cents / 100
+    
+    @savings.setter
+    def savings(self, value: float) -> None:
+        self._savings_cents = round(value * 100)
+    
+    @property
+    def autoSavingsPercentage(self) -> float:
+        """Share of each deposit moved to savings, as a percentage."""
+        whole, fraction = divmod(self._auto_savings_bp, 100)
+        return self._auto_savings_bp / 100 if fraction else whole
+    
+    @autoSavingsPercentage.setter
+    def autoSavingsPercentage(self, percentage: float) -> None:
+        self._auto_savings_bp = round(percentage * 100)
     
     def __str__(self) -> str:
         """Override the string representation of the account."""
@@ -72,15 +185,20 @@ class BankAccount(BankingInterface):
         """Override addition operator to combine balances."""
         if isinstance(other, (int, float)):
             # Adding money to the account
-            result = BankAccount(self.balance + other, self.name, self.creditLimit)
+            result = BankAccount(self.balance + other, self.name, self.creditLimit, _register=False)
             result.savings = self.savings
             result.transactions = self.transactions.copy()
             return result
         elif isinstance(other, BankAccount):
             # Combining two accounts
-            result = BankAccount(self.balance + other.balance, f"{self.name}+{other.name}", max(self.creditLimit, other.creditLimit)) 
+            result = BankAccount(
+                self.balance + other.balance, 
+                f"{self.name}+{other.name}", 
+                max(self.creditLimit, other.creditLimit), 
+                _register=False
+            )
             result.savings = self.savings + other.savings
-            result.transactions = self.transactions.copy() + other.transactions.copy()
+            result.transactions = self.transactions + other.transactions
             return result
         else:
             raise TypeError(f"Cannot add BankAccount and {type(other)}.")
@@ -90,7 +208,7 @@ class BankAccount(BankingInterface):
         if isinstance(other, (int, float)):
             if self.balance - other < -self.creditLimit:
                 raise BalanceException("❌ Insufficient funds for this operation.")
-            result = BankAccount(self.balance - other, self.name, self.creditLimit)
+            result = BankAccount(self.balance - other, self.name, self.creditLimit, _register=False)
             result.savings = self.savings
             result.transactions = self.transactions.copy()
             
@@ -119,17 +237,67 @@ class BankAccount(BankingInterface):
         raise TypeError(f"Cannot compare BankAccount with {type(other)}")
     
     def __enter__(self):
-        """Support for using accounts as context managers."""
+        """
+        Support for using accounts as context managers.
+        
+        Balances, credit score, last transaction time, loan state and the
+        ledger length are pushed onto a stack so a failed block (including a
+        nested one) can be rolled back to the state it started from. Loan
+        state is only captured when a loan manager already exists.
+        """
+        loans = self._loan_manager
+        if loans is None:
+            loan_state = None
+        else:
+            history = loans.loan_history
+            loan_state = (
+                loans.loan_balance,
+                loans.interest_rate,
+                len(history),
+                history[-1].status if history else None
+            )
+        self._context_snapshots.append((
+            self._balance_cents,
+            self._savings_cents,
+            self.credit_score,
+            self.last_transaction_time,
+            len(self.transactions),
+            loan_state
+        ))
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Handle context manager exit."""
-        # Log any exceptions that occurred
+        """Handle context manager exit, rolling back on exceptions."""
+        snapshot = self._context_snapshots.pop()
+        
+        # Log any exceptions that occurred and restore the snapshot
         if exc_type is not None:
-            logger.error(f"Exception during account context: {exc_type.__name__}: {exc_val}")
+            logger.error("Exception during account context: %s: %s", exc_type.__name__, exc_val)
+            self._restore_snapshot(snapshot)
             return False  # Don't suppress the exception
         return True
     
+    def _restore_snapshot(self, snapshot: tuple) -> None:
+        """Roll the account back to a state captured by __enter__."""
+        (self._balance_cents, self._savings_cents, self.credit_score,
+         self.last_transaction_time, transaction_count, loan_state) = snapshot
+        
+        # Drop ledger entries recorded inside the failed block
+        del self.transactions[transaction_count:]
+        
+        if loan_state is None:
+            # No loan manager existed on entry; discard one created inside the block
+            self._loan_manager = None
+            return
+        
+        loan_balance, interest_rate, loan_count, last_loan_status = loan_state
+        loans = self._loan_manager
+        loans.loan_balance = loan_balance
+        loans.interest_rate = interest_rate
+        del loans.loan_history[loan_count:]
+        if last_loan_status is not None:
+            loans.loan_history[-1].status = last_loan_status
+    
     @classmethod
     def get_account_by_id(cls, account_id: str) -> Optional['BankAccount']:
         """
@@ -147,19 +315,54 @@ class BankAccount(BankingInterface):
     
     @classmethod
     def get_all_accounts(cls) -> Dict[str, 'BankAccount']:
-        """Get all registered accounts."""
-        return cls._all_accounts.copy()
+        """Get all registered accounts that are still alive."""
+        return dict(cls._all_accounts)
+    
+    @classmethod
+    def _register_restored(cls, account: 'BankAccount') -> None:
+        """
+        Register a deserialized account under its restored ID.
+        
+        Shared by deserialize() and deserialize_binary(). A live account that
+        already holds the ID keeps its registry entry, so restoring a copy never
+        hides (or, once the copy is collected, drops) the original.
+        """
+        cls._all_accounts.setdefault(account.account_id, account)
+    
+    @classmethod
+    def enable_single_threaded_mode(cls) -> None:
+        """
+        Use the lightweight transaction context for all accounts.
+        
+        Intended for single-threaded batch jobs (imports, reconciliation) where
+        per-transaction bookkeeping dominates. Rollback on error still applies.
+        """
+        cls._single_threaded_mode = True
+        logger.info("Single-threaded mode enabled")
+    
+    @classmethod
+    def disable_single_threaded_mode(cls) -> None:
+        """Restore the full transaction context for all accounts."""
+        cls._single_threaded_mode = False
+        logger.info("Single-threaded mode disabled")
     
     @staticmethod
     def _generate_account_id(name: str, amount: float) -> str:
-        """Generate a unique account ID using hashing."""
-        seed = f"{name}{amount}{datetime.now()}"
-        return hashlib.sha256(seed.encode()).hexdigest()[:12]
+        """Generate a unique 12-character account ID using BLAKE2b hashing."""
+        seed = f"{name}{amount}{time.time_ns()}"
+        return hashlib.blake2b(seed.encode(), digest_size=6).hexdigest()
     
-    def add_transaction(self, transaction: Transaction) -> None:
-        """Add a transaction to the account history."""
+    def add_transaction(self, transaction: Transaction, now: Optional[datetime] = None) -> None:
+        """
+        Add a transaction to the account history.
+        
+        Args:
+            transaction: Transaction to record
+            now: Timestamp to record as the last transaction time; bulk callers
+                can capture it once and reuse it instead of reading the clock per call
+        """
         self.transactions.append(transaction)
-        self.last_transaction_time = datetime.now()  # Update transaction time
+        self.last_transaction_time = now if now is not None else datetime.now()
     
     @transaction_logger
     def deposit(self, amount: float, description: str = "Deposited amount") -> TransactionResult:
@@ -168,9 +371,12 @@ class BankAccount(BankingInterface):
         self.security.check_operation_allowed("deposit")
             
         with transaction_context(self):
-            savingsAmount = amount * (self.autoSavingsPercentage / 100)
-            self.balance += (amount - savingsAmount)
-            self.savings += savingsAmount
+            # Split in exact integer cents; any sub-cent remainder stays in balance
+            amount_cents = round(amount * 100)
+            savings_cents = amount_cents * self._auto_savings_bp // 10_000
+            self._balance_cents += amount_cents - savings_cents
+            self._savings_cents += savings_cents
+            savingsAmount = savings_cents / 100
             
             # Create and add transaction
             tx = Transaction(
@@ -181,7 +387,7 @@ class BankAccount(BankingInterface):
             )
             self.add_transaction(tx)
         
-        print(f"✅ Deposited ${amount:.2f}. Auto-Saved: ${savingsAmount:.2f}\n")
+        logger.info("Deposited $%.2f to %s. Auto-Saved: $%.2f", amount, self.name, savingsAmount)
         
         return TransactionResult(
             success=True,
@@ -214,7 +420,7 @@ class BankAccount(BankingInterface):
                 )
                 self.add_transaction(tx)
             
-            print(f"✅ Withdrawn ${amount:.2f}. New balance: ${self.balance:.2f}\n")
+            logger.info("Withdrawn $%.2f from %s. New balance: $%.2f", amount, self.name, self.balance)
             
             return TransactionResult(
                 success=True,
@@ -223,7 +429,7 @@ class BankAccount(BankingInterface):
                 new_balance=self.balance
             )
         else:
-            print("❌ Insufficient funds, even with overdraft.\n")
+            logger.warning("Withdrawal of $%.2f from %s refused: insufficient funds, even with overdraft", amount, self.name)
             
             return TransactionResult(
                 success=False,
@@ -246,7 +452,7 @@ class BankAccount(BankingInterface):
         """Deduct monthly maintenance fee."""
         fee = 5
         if self.balance - fee < -self.creditLimit:
-            print(f"⚠ Insufficient funds to deduct maintenance fee.\n")
+            logger.warning("Insufficient funds to deduct maintenance fee from %s", self.name)
             
             return TransactionResult(
                 success=False,
@@ -267,7 +473,7 @@ class BankAccount(BankingInterface):
                 )
                 self.add_transaction(tx)
             
-            print(f"⚠ Maintenance Fee Deducted: ${fee:.2f}. New Balance: ${self.balance:.2f}\n")
+            logger.info("Maintenance fee of $%.2f deducted from %s. New balance: $%.2f", fee, self.name, self.balance)
             
             return TransactionResult(
                 success=True,
@@ -289,14 +495,20 @@ class BankAccount(BankingInterface):
         if not (0 <= percentage <= 100):
             raise ValueError("❌ Error: Auto-savings percentage must be between 0 and 100.")
         self.autoSavingsPercentage = percentage
-        logger.info(f"Auto-savings set to {percentage}% for {self.name}")
-        print(f"💰 Auto-Savings enabled: {percentage}% of deposits will be saved.\n")
+        logger.info("Auto-savings set to %s%% for %s", percentage, self.name)
+        if VERBOSE_UI:
+            print(f"💰 Auto-Savings enabled: {percentage}% of deposits will be saved.\n")
 
     def convert_currency(self, amount: float, from_currency: str, to_currency: str) -> float:
         """Convert currency using AI-predicted rates."""
+        # Same-currency conversions need no rate lookup (and must not get a simulated one)
+        if from_currency == to_currency:
+            return amount
+        
         rate = AIServices.predict_currency_conversion(from_currency, to_currency)
         converted_amount = amount * rate
-        print(f"💱 {amount:.2f} {from_currency} = {converted_amount:.2f} {to_currency} (Rate: {rate:.2f})\n")
+        if VERBOSE_UI:
+            print(f"💱 {amount:.2f} {from_currency} = {converted_amount:.2f} {to_currency} (Rate: {rate:.2f})\n")
         return converted_amount
     
     def serialize(self) -> Dict[str, Any]:
@@ -319,7 +531,7 @@ class BankAccount(BankingInterface):
             'transactions': [t.to_dict() for t in self.transactions],
             'loan_balance': self.loan_manager.loan_balance,
             'interest_rate': self.loan_manager.interest_rate,
-            'loan_history': self.loan_manager.loan_history,
+            'loan_history': [loan.to_dict() for loan in self.loan_manager.loan_history],
             'linked_accounts': list(self.account_linking.external_ids.keys()),
             'last_transaction_time': str(self.last_transaction_time)  # Add this field
         }
@@ -333,14 +545,14 @@ class BankAccount(BankingInterface):
             data: Dictionary with account data
             
         Returns:
-            Reconstructed BankAccount object
+            Reconstructed BankAccount object, registered under its restored ID
+            unless a live account already holds that ID
         """
-        account = cls(data['balance'], data['name'], data['credit_limit'])
+        account = cls(data['balance'], data['name'], data['credit_limit'], data['provider'], _register=False)
         
         # Restore basic properties
         account.account_id = data['account_id']
         account.savings = data['savings']
-        account.provider = data['provider']
         account.credit_score = data['credit_score']
         account.autoSavingsPercentage = data['auto_savings_percentage']
         account.status = AccountStatus(data['status'])
@@ -351,40 +563,178 @@ class BankAccount(BankingInterface):
         # Restore loan data
         account.loan_manager.loan_balance = data['loan_balance']
         account.loan_manager.interest_rate = data['interest_rate']
-        account.loan_manager.loan_history = data['loan_history']
+        account.loan_manager.loan_history = [LoanRecord.from_dict(loan) for loan in data['loan_history']]
         
         # Restore last transaction time if available
-        if 'last_transaction_time' in data:
-            try:
-                account.last_transaction_time = datetime.fromisoformat(data['last_transaction_time'])
-            except (ValueError, TypeError):
-                # If there's any issue parsing the datetime, use current time
-                account.last_transaction_time = datetime.now()
-        else:
+        last_transaction_time = data.get('last_transaction_time')
+        try:
+            account.last_transaction_time = datetime.fromisoformat(last_transaction_time)
+        except (ValueError, TypeError):
+            # If it's missing or there's any issue parsing the datetime, use current time
             account.last_transaction_time = datetime.now()
         
+        cls._register_restored(account)
+        return account
+    
+    def serialize_binary(self) -> bytes:
+        """
+        Serialize the account to a compact binary snapshot.
+        
+        Fixed-size fields are packed with struct and strings are length-prefixed,
+        avoiding the per-transaction dictionaries built by serialize(). Use
+        deserialize_binary() to restore.
+        
+        Returns:
+            Bytes representation of the account
+        """
+        loan_manager = self.loan_manager
+        linked_providers = list(self.account_linking.external_ids.keys())
+        parts = [_ACCOUNT_HEADER.pack(
+            _BINARY_VERSION,
+            self._balance_cents,
+            self._savings_cents,
+            self.creditLimit,
+            self.credit_score,
+            self._auto_savings_bp,
+            loan_manager.loan_balance,
+            loan_manager.interest_rate,
+            len(self.transactions),
+            len(loan_manager.loan_history),
+            len(linked_providers)
+        )]
+        
+        for value in (self.account_id, self.name, self.provider, self.status.value, 
+                      self.last_transaction_time.isoformat()):
+            _pack_str(parts, value)
+        
+        for t in self.transactions:
+            parts.append(_TRANSACTION_RECORD.pack(_TRANSACTION_TYPE_CODES[t.transaction_type], t.amount))
+            _pack_str(parts, t.transaction_id)
+            _pack_str(parts, t.timestamp.isoformat())
+            _pack_str(parts, t.description)
+            _pack_str(parts, t.provider)
+        
+        for loan in loan_manager.loan_history:
+            parts.append(_LOAN_RECORD.pack(loan.amount, loan.interest_rate))
+            _pack_str(parts, loan.date)
+            _pack_str(parts, loan.loan_type)
+            _pack_str(parts, loan.status)
+        
+        for provider in linked_providers:
+            _pack_str(parts, provider)
+        
+        return b''.join(parts)
+    
+    @classmethod
+    def deserialize_binary(cls, data: bytes) -> 'BankAccount':
+        """
+        Create an account from a snapshot produced by serialize_binary().
+        
+        Args:
+            data: Bytes with account data
+            
+        Returns:
+            Reconstructed BankAccount object, registered under its restored ID
+            unless a live account already holds that ID
+        """
+        buffer = memoryview(data)
+        (version, balance_cents, savings_cents, credit_limit, credit_score, auto_savings_bp,
+         loan_balance, interest_rate, transaction_count, loan_count, _linked_count) = _ACCOUNT_HEADER.unpack_from(buffer)
+        if version != _BINARY_VERSION:
+            raise ValueError(f"❌ Error: Unsupported account snapshot version {version}.")
+        offset = _ACCOUNT_HEADER.size
+        
+        account_id, offset = _unpack_str(buffer, offset)
+        name, offset = _unpack_str(buffer, offset)
+        provider, offset = _unpack_str(buffer, offset)
+        status, offset = _unpack_str(buffer, offset)
+        last_transaction_time, offset = _unpack_str(buffer, offset)
+        
+        # Build unregistered; registered under the restored ID at the end
+        account = cls(0, name, credit_limit, provider, _register=False)
+        account.account_id = account_id
+        account._balance_cents = balance_cents
+        account._savings_cents = savings_cents
+        account.credit_score = credit_score
+        account._auto_savings_bp = auto_savings_bp
+        account.status = AccountStatus(status)
+        account.last_transaction_time = datetime.fromisoformat(last_transaction_time)
+        
+        # Restore transactions
+        transactions = []
+        for _ in range(transaction_count):
+            type_code, amount = _TRANSACTION_RECORD.unpack_from(buffer, offset)
+            offset += _TRANSACTION_RECORD.size
+            transaction_id, offset = _unpack_str(buffer, offset)
+            timestamp, offset = _unpack_str(buffer, offset)
+            description, offset = _unpack_str(buffer, offset)
+            tx_provider, offset = _unpack_str(buffer, offset)
+            
+            transaction = Transaction(_TRANSACTION_TYPES[type_code], amount, description, tx_provider)
+            transaction.timestamp = datetime.fromisoformat(timestamp)
+            transaction.transaction_id = transaction_id
+            transactions.append(transaction)
+        account.transactions = transactions
+        
+        # Restore loan data
+        loan_history = []
+        for _ in range(loan_count):
+            amount, loan_rate = _LOAN_RECORD.unpack_from(buffer, offset)
+            offset += _LOAN_RECORD.size
+            date, offset = _unpack_str(buffer, offset)
+            loan_type, offset = _unpack_str(buffer, offset)
+            loan_status, offset = _unpack_str(buffer, offset)
+            loan_history.append(LoanRecord(date, amount, loan_rate, loan_type, loan_status))
+        account.loan_manager.loan_balance = loan_balance
+        account.loan_manager.interest_rate = interest_rate
+        account.loan_manager.loan_history = loan_history
+        
+        cls._register_restored(account)
+        
+        # Linked providers are recorded for reference only; like deserialize(),
+        # links are re-established by the caller
         return account
     
     # Delegation methods for account linking
     def link_external_account(self, external_account) -> bool:
         """Link an external bank account to this primary account."""
         return self.account_linking.link_account(external_account)
+    
+    def link_external_accounts(self, external_accounts: Iterable['BankAccount']) -> int:
+        """Link several external accounts at once; returns how many were linked."""
+        return self.account_linking.link_accounts(external_accounts)
 
     def unlink_account(self, provider_name: str) -> bool:
         """Unlink an external account by provider name."""
         return self.account_linking.unlink_account(provider_name)
 
-    def get_consolidated_balance(self) -> Tuple[float, float]:
+    def get_consolidated_balance(self, async_fetch: bool = False) -> Tuple[float, float]:
         """Get total balance across all linked accounts."""
-        return self.account_linking.get_consolidated_balance()
+        return self.account_linking.get_consolidated_balance(async_fetch)
         
     def transfer_between_accounts(self, to_provider: str, amount: float) -> TransactionResult:
         """Transfer money between linked accounts."""
         return self.account_linking.transfer_between_accounts(to_provider, amount)
 
+    def iter_all_transactions(self) -> Iterator[Transaction]:
+        """Lazily yield transactions from this account, then from each linked account."""
+        return self._iter_transaction_history(self.account_linking.linked_accounts)
+    
     def full_transaction_history(self) -> List[Transaction]:
         """Get transaction history from all linked accounts."""
-        all_transactions = self.transactions.copy()
+        return list(self.iter_all_transactions())
+    
+    def _iter_transaction_history(self, linked_accounts) -> Iterator[Transaction]:
+        """Chain this account's transactions with those of a snapshot of linked accounts."""
+        return itertools.chain(
+            self.transactions,
+            *(account.transactions for account in linked_accounts)
+        )
+    
+    def print_full_transaction_history(self) -> List[Transaction]:
+        """Print and return transaction history from all linked accounts."""
+        linked_accounts = self.account_linking.linked_accounts
+        ensure_utf8_stdout()
         
         print(f"📜 Full Transaction History Across All Accounts:")
         print(f"🔹 Primary Account ({self.name}):")
@@ -395,13 +745,12 @@ class BankAccount(BankingInterface):
             for transaction in self.transactions:
                 print(f"   ↪ {transaction}")
                 
-        for account in self.account_linking.linked_accounts:
+        for account in linked_accounts:
             print(f"🔹 {account.provider} Account ({account.name}):")
             if not account.transactions:
                 print("   ℹ No transactions yet.\n") 
             else:
                 for transaction in account.transactions:
                     print(f"   ↪ {transaction}")
-                    all_transactions.append(transaction)
                     
-        return all_transactions
+        return list(self._iter_transaction_history(linked_accounts))
@@ -1,6 +1,7 @@
 """Account linking functionality for multi-bank integration."""
+from datetime import datetime
 import threading
-from typing import List, Dict, Tuple
+from typing import Any, Iterable, List, Dict, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from .utils import logger, transaction_context, transaction_logger
@@ -10,75 +11,121 @@ from .models import Transaction, TransactionType, TransactionResult
 class AccountLinking:
     """Class to handle multi-bank account linking."""
     
+    __slots__ = ('primary_account', 'linked_accounts_by_id', 'external_ids', '_lock', '_linked_snapshot')
+    
     def __init__(self, primary_account):
         """Initialize the account linking manager."""
         self.primary_account = primary_account
-        self.linked_accounts = []
+        self.linked_accounts_by_id: Dict[str, Any] = {}
         self.external_ids = {}
-        self._lock = threading.RLock()  # Re-entrant lock for thread safety
+        self._lock = threading.RLock()  # Re-entrant lock for writers
+        # Immutable snapshot of linked accounts, rebound by writers under the lock
+        # so readers can take a consistent view without locking
+        self._linked_snapshot: Tuple[Any, ...] = ()
+    
+    @property
+    def linked_accounts(self) -> Tuple[Any, ...]:
+        """Snapshot of linked accounts in the order they were linked."""
+        return self._linked_snapshot
         
     def link_account(self, external_account) -> bool:
         """Link an external bank account to the primary account."""
         # Thread safety with a lock
         with self._lock:
-            if external_account.account_id == self.primary_account.account_id:
-                logger.warning(f"Attempted to link account to itself: {self.primary_account.name}")
-                print(f"❌ Cannot link an account to itself.\n")
+            if not self._add_link(external_account):
                 return False
-                
-            # Check if account is already linked
-            for account in self.linked_accounts:
-                if account.account_id == external_account.account_id:
-                    print(f"ℹ️ Account '{external_account.name}' is already linked.\n")
-                    return False
-                    
-            self.linked_accounts.append(external_account)
-            self.external_ids[external_account.provider] = external_account.account_id
-            
-            logger.info(f"Account linked: {external_account.name} from {external_account.provider}")
-            print(f"✅ Successfully linked '{external_account.name}' from {external_account.provider}.\n")
+            self._linked_snapshot = self._linked_snapshot + (external_account,)
             return True
+    
+    def link_accounts(self, external_accounts: Iterable[Any]) -> int:
+        """
+        Link several external accounts in one locked pass.
+        
+        The snapshot tuple is rebuilt once for the whole batch rather than
+        once per account.
+        
+        Args:
+            external_accounts: Accounts to link, in order
+            
+        Returns:
+            Number of accounts that were newly linked
+        """
+        with self._lock:
+            added = tuple(account for account in external_accounts if self._add_link(account))
+            if added:
+                self._linked_snapshot = self._linked_snapshot + added
+            return len(added)
+    
+    def _add_link(self, external_account) -> bool:
+        """Validate and index one account; the caller holds the lock and updates the snapshot."""
+        if external_account.account_id == self.primary_account.account_id:
+            logger.warning("Attempted to link account to itself: %s", self.primary_account.name)
+            return False
+            
+        # Check if account is already linked
+        if external_account.account_id in self.linked_accounts_by_id:
+            logger.info("Account already linked: %s", external_account.name)
+            return False
+                
+        self.linked_accounts_by_id[external_account.account_id] = external_account
+        self.external_ids[external_account.provider] = external_account.account_id
+        
+        logger.info("Account linked: %s from %s", external_account.name, external_account.provider)
+        return True
         
     def unlink_account(self, provider_name: str) -> bool:
         """Unlink an external account by provider name."""
         with self._lock:
             if provider_name not in self.external_ids:
-                print(f"❌ No linked account from {provider_name}.\n")
+                logger.warning("No linked account from %s", provider_name)
                 return False
                 
             account_id = self.external_ids[provider_name]
-            for i, account in enumerate(self.linked_accounts):
-                if account.account_id == account_id:
-                    removed = self.linked_accounts.pop(i)
-                    del self.external_ids[provider_name]
-                    
-                    logger.info(f"Account unlinked: {removed.name} from {provider_name}")
-                    print(f"✅ Unlinked account '{removed.name}' from {provider_name}.\n")
-                    return True
-                    
-            return False
-        
-    def get_consolidated_balance(self) -> Tuple[float, float]:
-        """Get total balance across all linked accounts."""
-        with self._lock:
-            total_balance = self.primary_account.balance
-            total_savings = self.primary_account.savings
+            removed = self.linked_accounts_by_id.pop(account_id, None)
+            if removed is None:
+                return False
+                
+            del self.external_ids[provider_name]
+            self._linked_snapshot = tuple(self.linked_accounts_by_id.values())
             
-            # Using ThreadPoolExecutor for parallel processing
+            logger.info("Account unlinked: %s from %s", removed.name, provider_name)
+            return True
+        
+    def get_consolidated_balance(self, async_fetch: bool = False) -> Tuple[float, float]:
+        """
+        Get total balance across all linked accounts.
+        
+        Balances are plain in-memory attribute reads, so they are summed
+        directly. Pass async_fetch=True to fan the reads out over a thread
+        pool once they are backed by real calls to external banks.
+        """
+        # Lock-free read: the snapshot tuple is never mutated in place
+        linked = self._linked_snapshot
+        
+        if async_fetch:
             def get_account_balances(account):
                 # In a real system, this might involve API calls to external banks
                 return account.balance, account.savings
             
-            # Process accounts in parallel for better performance with many accounts
             with ThreadPoolExecutor(max_workers=10) as executor:
-                results = list(executor.map(get_account_balances, self.linked_accounts))
-                
-            for bal, sav in results:
-                total_balance += bal
-                total_savings += sav
+                results = list(executor.map(get_account_balances, linked))
                 
-            print(f"💰 Consolidated Balance: ${total_balance:.2f} | Total Savings: ${total_savings:.2f}\n")
-            return total_balance, total_savings
+            total_balance = self.primary_account.balance + sum(bal for bal, _ in results)
+            total_savings = self.primary_account.savings + sum(sav for _, sav in results)
+        else:
+            # Single pass over the integer cents: exact, and no per-account
+            # float conversion through the balance/savings properties
+            primary = self.primary_account
+            balance_cents = primary._balance_cents
+            savings_cents = primary._savings_cents
+            for account in linked:
+                balance_cents += account._balance_cents
+                savings_cents += account._savings_cents
+            total_balance = balance_cents / 100
+            total_savings = savings_cents / 100
+            
+        logger.info("Consolidated balance: $%.2f | Total savings: $%.2f", total_balance, total_savings)
+        return total_balance, total_savings
         
     @transaction_logger
     def transfer_between_accounts(self, to_provider: str, amount: float) -> TransactionResult:
@@ -100,12 +147,8 @@ class AccountLinking:
                     new_balance=self.primary_account.balance
                 )
                 
-            # Find the target account
-            target_account = None
-            for account in self.linked_accounts:
-                if account.provider == to_provider:
-                    target_account = account
-                    break
+            # Find the target account through the provider -> id index
+            target_account = self.linked_accounts_by_id.get(self.external_ids[to_provider])
                     
             if not target_account:
                 return TransactionResult(
@@ -134,11 +177,12 @@ class AccountLinking:
                     to_provider
                 )
                 
-                self.primary_account.add_transaction(source_tx)
-                target_account.add_transaction(target_tx)
+                # Both legs of the transfer share one timestamp
+                now = datetime.now()
+                self.primary_account.add_transaction(source_tx, now)
+                target_account.add_transaction(target_tx, now)
             
-            logger.info(f"Transfer completed: ${amount:.2f} from {self.primary_account.name} to {target_account.name}")
-            print(f"✅ Transferred ${amount:.2f} to {to_provider} account ({target_account.name}).\n")
+            logger.info("Transfer completed: $%.2f from %s to %s", amount, self.primary_account.name, target_account.name)
             
             return TransactionResult(
                 success=True,
@@ -1,14 +1,18 @@
 """AI-powered banking services."""
+import functools
 import random
 from typing import List, Dict, ClassVar, Final
 
-from .utils import logger, retry
+from .utils import logger, retry, VERBOSE_UI
 from .models import Transaction
 
 
 class AIServices:
     """Class for AI-powered banking services."""
     
+    # Only static/class-level members; instances carry no state
+    __slots__ = ()
+    
     # Service status
     _service_status: ClassVar[str] = "operational"
     
@@ -17,8 +21,9 @@ class AIServices:
         """Detect potentially fraudulent transactions based on amount."""
         threshold = account_avg * 3
         if transaction_amount > threshold:
-            logger.warning(f"Potential fraud detected: ${transaction_amount:.2f} (threshold: ${threshold:.2f})")
-            print("🚨 AI Alert: Suspicious transaction detected! Possible fraud.\n")
+            logger.warning("Potential fraud detected: $%.2f (threshold: $%.2f)", transaction_amount, threshold)
+            if VERBOSE_UI:
+                print("🚨 AI Alert: Suspicious transaction detected! Possible fraud.\n")
             return True
         return False
         
@@ -27,31 +32,28 @@ class AIServices:
         """Perform AI-driven budget analysis on transaction history."""
         categories = {"food": 0, "entertainment": 0, "shopping": 0, "other": 0}
         
-        # Analyze transactions
+        # Categories are tagged once when each transaction is created
         for transaction in transaction_history:
-            if "food" in transaction.description.lower():
-                categories["food"] += transaction.amount
-            elif "entertainment" in transaction.description.lower():
-                categories["entertainment"] += transaction.amount
-            elif "shop" in transaction.description.lower():
-                categories["shopping"] += transaction.amount
-            else:
-                categories["other"] += transaction.amount
+            categories[transaction.category] += transaction.amount
                 
-        print("📊 AI Smart Budgeting Analysis:")
-        for category, amount in categories.items():
-            print(f"💰 You spent ${amount:.2f} on {category} this month.")
+        if VERBOSE_UI:
+            print("📊 AI Smart Budgeting Analysis:")
+            for category, amount in categories.items():
+                print(f"💰 You spent ${amount:.2f} on {category} this month.")
         
         return categories
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     @retry(max_attempts=3, delay_seconds=1.0)
     def predict_currency_conversion(from_currency: str, to_currency: str) -> float:
         """
         Get currency exchange rates with built-in retry logic.
         
         The @retry decorator demonstrates how to make external API calls more robust
-        by automatically retrying on failure.
+        by automatically retrying on failure. Successful rates are memoized per
+        currency pair, so repeat conversions skip the simulated API call entirely;
+        failures are not cached and will be retried on the next call.
         
         Args:
             from_currency: Source currency code
@@ -88,4 +90,4 @@ class AIServices:
     def set_service_status(cls, status: str) -> None:
         """Update the service status."""
         cls._service_status = status
-        logger.info(f"AI service status changed to: {status}")
+        logger.info("AI service status changed to: %s", status)
@@ -0,0 +1,74 @@
+"""Console adapter that prints user-facing messages for account operations."""
+from typing import Tuple
+
+from .models import TransactionResult
+from .utils import ensure_utf8_stdout
+
+
+class BankAccountCLI:
+    """
+    Wraps a BankAccount and prints the outcome of each operation.
+
+    The account API itself only logs, so programmatic callers don't pay for
+    console output; interactive front-ends go through this adapter instead.
+    """
+
+    def __init__(self, account):
+        """Initialize the adapter around an account."""
+        self.account = account
+        ensure_utf8_stdout()
+
+    @staticmethod
+    def _report(result: TransactionResult) -> TransactionResult:
+        """Print a transaction result and pass it through."""
+        icon = "✅" if result.success else "❌"
+        print(f"{icon} {result.message}\n")
+        return result
+
+    def deposit(self, amount: float, description: str = "Deposited amount") -> TransactionResult:
+        """Deposit money and print the outcome."""
+        return self._report(self.account.deposit(amount, description))
+
+    def withdraw(self, amount: float, description: str = "Withdrew amount") -> TransactionResult:
+        """Withdraw money and print the outcome."""
+        return self._report(self.account.withdraw(amount, description))
+
+    def deduct_maintenance_fee(self) -> TransactionResult:
+        """Deduct the maintenance fee and print the outcome."""
+        return self._report(self.account.deduct_maintenance_fee())
+
+    def borrow(self, amount: float, loan_type: str = 'personal') -> TransactionResult:
+        """Request a loan and print the outcome."""
+        return self._report(self.account.borrow(amount, loan_type))
+
+    def repay_loan(self, amount: float) -> TransactionResult:
+        """Repay a loan and print the outcome."""
+        return self._report(self.account.repay_loan(amount))
+
+    def transfer_between_accounts(self, to_provider: str, amount: float) -> TransactionResult:
+        """Transfer to a linked account and print the outcome."""
+        return self._report(self.account.transfer_between_accounts(to_provider, amount))
+
+    def link_external_account(self, external_account) -> bool:
+        """Link an external account and print the outcome."""
+        linked = self.account.link_external_account(external_account)
+        if linked:
+            print(f"✅ Successfully linked '{external_account.name}' from {external_account.provider}.\n")
+        else:
+            print(f"❌ Could not link '{external_account.name}'.\n")
+        return linked
+
+    def unlink_account(self, provider_name: str) -> bool:
+        """Unlink an external account and print the outcome."""
+        unlinked = self.account.unlink_account(provider_name)
+        if unlinked:
+            print(f"✅ Unlinked account from {provider_name}.\n")
+        else:
+            print(f"❌ No linked account from {provider_name}.\n")
+        return unlinked
+
+    def get_consolidated_balance(self) -> Tuple[float, float]:
+        """Print the total balance across all linked accounts."""
+        total_balance, total_savings = self.account.get_consolidated_balance()
+        print(f"💰 Consolidated Balance: ${total_balance:.2f} | Total Savings: ${total_savings:.2f}\n")
+        return total_balance, total_savings
@@ -1,9 +1,9 @@
 """Loan management functionality for the banking system."""
 from datetime import datetime
-from typing import Dict, List, Any, Final, Literal
+from typing import Dict, List, Final, Literal, Sequence
 
 from .utils import logger, transaction_context, transaction_logger
-from .models import Transaction, TransactionType, TransactionResult
+from .models import Transaction, TransactionType, TransactionResult, LoanRecord
 
 
 class LoanManager:
@@ -17,13 +17,21 @@ class LoanManager:
         'business': 0.06     # 6%
     }
     
+    # Credit score multipliers that cap the approvable amount per loan type
+    _LOAN_MULTIPLIERS: Final[Dict[str, float]] = {
+        'personal': 2,
+        'auto': 3,
+        'mortgage': 10,
+        'business': 5
+    }
+    
     def __init__(self, account):
         """Initialize the loan manager."""
         self.account = account
         self.loan_balance = 0
         self.interest_rate = self.DEFAULT_RATES['personal']
         self.payment_schedule = []
-        self.loan_history: List[Dict[str, Any]] = []
+        self.loan_history: List[LoanRecord] = []
         
     @transaction_logger
     def request_loan(
@@ -41,12 +49,14 @@ class LoanManager:
         Returns:
             TransactionResult with details of the operation
         """
+        account = self.account
+        
         if self.loan_balance > 0:
             return TransactionResult(
                 success=False,
                 message="Loan Request Denied: You have an active loan",
                 amount=amount,
-                new_balance=self.account.balance
+                new_balance=account.balance
             )
             
         max_borrowable = self.predict_loan_approval(amount, loan_type)
@@ -55,44 +65,47 @@ class LoanManager:
                 success=False,
                 message=f"Loan Request Denied: Max you can borrow is ${max_borrowable:.2f}",
                 amount=amount,
-                new_balance=self.account.balance
+                new_balance=account.balance
             )
         
         # Set appropriate interest rate
-        self.interest_rate = self.DEFAULT_RATES.get(loan_type, self.DEFAULT_RATES['personal'])
+        rate = self.DEFAULT_RATES.get(loan_type, self.DEFAULT_RATES['personal'])
+        self.interest_rate = rate
             
         # Process loan in a thread-safe manner
-        with transaction_context(self.account):
+        with transaction_context(account):
             self.loan_balance = amount
-            self.account.balance += amount
-            self.account.credit_score -= 30
+            account.balance += amount
+            account.credit_score -= 30
             
             # Create transaction record
             transaction = Transaction(
                 TransactionType.LOAN, 
                 amount, 
                 f"Loan approved: {loan_type} loan", 
-                self.account.provider
+                account.provider
             )
-            self.account.add_transaction(transaction)
+            account.add_transaction(transaction)
             
             # Record in loan history
-            self.loan_history.append({
-                'date': datetime.now().isoformat(),
-                'amount': amount,
-                'interest_rate': self.interest_rate,
-                'loan_type': loan_type,
-                'status': 'active'
-            })
+            self.loan_history.append(LoanRecord(
+                date=datetime.now().isoformat(),
+                amount=amount,
+                interest_rate=rate,
+                loan_type=loan_type,
+                status='active'
+            ))
         
-        logger.info(f"Loan approved for {self.account.name}: ${amount:.2f} ({loan_type} loan at {self.interest_rate*100:.1f}%)")
-        print(f"✅ Loan Approved! Borrowed ${amount:.2f}. New Balance: ${self.account.balance:.2f}\n")
+        logger.info(
+            "Loan approved for %s: $%.2f (%s loan at %.1f%%)",
+            account.name, amount, loan_type, rate * 100
+        )
         
         return TransactionResult(
             success=True,
             message=f"Loan Approved! Borrowed ${amount:.2f}",
             amount=amount,
-            new_balance=self.account.balance
+            new_balance=account.balance
         )
         
     @transaction_logger
@@ -106,47 +119,48 @@ class LoanManager:
         Returns:
             TransactionResult with details of the operation
         """
+        account = self.account
+        
         if amount > self.loan_balance:
             return TransactionResult(
                 success=False,
                 message="You can't repay more than your loan balance",
                 amount=amount,
-                new_balance=self.account.balance
+                new_balance=account.balance
             )
             
-        if self.account.balance < amount:
+        if account.balance < amount:
             return TransactionResult(
                 success=False,
                 message="Insufficient funds to repay loan",
                 amount=amount,
-                new_balance=self.account.balance
+                new_balance=account.balance
             )
             
-        with transaction_context(self.account):
-            self.account.balance -= amount
+        with transaction_context(account):
+            account.balance -= amount
             self.loan_balance -= amount
-            self.account.credit_score += 20
+            account.credit_score += 20
             
             transaction = Transaction(
                 TransactionType.REPAYMENT, 
                 amount, 
                 "Repaid loan amount", 
-                self.account.provider
+                account.provider
             )
-            self.account.add_transaction(transaction)
+            account.add_transaction(transaction)
             
             # Update loan history
             if self.loan_balance == 0:
-                self.loan_history[-1]['status'] = 'repaid'
+                self.loan_history[-1].status = 'repaid'
         
-        logger.info(f"Loan payment of ${amount:.2f} processed for {self.account.name}")
-        print(f"✅ Repaid ${amount:.2f}. Remaining Loan: ${self.loan_balance:.2f}\n")
+        logger.info("Loan payment of $%.2f processed for %s", amount, account.name)
         
         return TransactionResult(
             success=True,
             message=f"Repaid ${amount:.2f}. Remaining Loan: ${self.loan_balance:.2f}",
             amount=amount,
-            new_balance=self.account.balance
+            new_balance=account.balance
         )
         
     def predict_loan_approval(self, requested_amount: float, loan_type: str = 'personal') -> float:
@@ -160,16 +174,44 @@ class LoanManager:
         Returns:
             Maximum amount that would be approved
         """
-        # Different loan types have different approval algorithms
-        if loan_type == 'personal':
-            max_loan = self.account.credit_score * 2
-        elif loan_type == 'auto':
-            max_loan = self.account.credit_score * 3
-        elif loan_type == 'mortgage':
-            max_loan = self.account.credit_score * 10
-        elif loan_type == 'business':
-            max_loan = self.account.credit_score * 5
-        else:
-            max_loan = self.account.credit_score * 1.5
+        # Different loan types allow different multiples of the credit score
+        multiplier = self._LOAN_MULTIPLIERS.get(loan_type, 1.5)
+        return min(self.account.credit_score * multiplier, requested_amount)
+    
+    @classmethod
+    def batch_predict(
+        cls, 
+        credit_scores: Sequence[float], 
+        requested_amounts: Sequence[float], 
+        loan_types: Sequence[str]
+    ) -> List[float]:
+        """
+        Predict maximum approvable amounts for many loan requests at once.
+        
+        Applies the same rule as predict_loan_approval to parallel sequences,
+        e.g. for pricing a portfolio or stress-testing credit score scenarios.
+        
+        Args:
+            credit_scores: Credit score of each applicant
+            requested_amounts: Requested loan amount for each applicant
+            loan_types: Loan type of each request
             
-        return min(max_loan, requested_amount)
+        Returns:
+            Maximum amount that would be approved for each request
+            
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        count = len(credit_scores)
+        if len(requested_amounts) != count or len(loan_types) != count:
+            raise ValueError("❌ Error: Batch prediction inputs must have the same length.")
+        
+        # Resolve each distinct loan type's multiplier once instead of per request
+        multipliers = {
+            loan_type: cls._LOAN_MULTIPLIERS.get(loan_type, 1.5)
+            for loan_type in set(loan_types)
+        }
+        return [
+            min(score * multipliers[loan_type], amount)
+            for score, amount, loan_type in zip(credit_scores, requested_amounts, loan_types)
+        ]
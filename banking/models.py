@@ -4,9 +4,13 @@ from datetime import datetime, timedelta
 import enum
 import dataclasses
 import hashlib
-import random
+import itertools
+import os
+import threading
 from typing import List, Dict, Union, Optional, ClassVar, Any, Literal, Protocol
 
+from .utils import next_transaction_id
+
 # Exception hierarchy
 class BalanceException(Exception):
     """Custom exception for balance-related errors."""
@@ -24,12 +28,13 @@ class LinkingException(Exception):
 
 
 # Enums for type safety
-class TransactionType(enum.Enum):
+class TransactionType(str, enum.Enum):
     """
     Enumeration of transaction types.
     
     This demonstrates Python's enum module which provides symbolic names for a set
-    of related values, making code more readable and type-safe.
+    of related values, making code more readable and type-safe. Mixing in str
+    makes each member usable directly as its string value.
     """
     DEPOSIT = "deposit"
     WITHDRAWAL = "withdrawal"
@@ -68,6 +73,10 @@ class Lockable(Protocol):
     def unlock_account(self, verification_code: Optional[str] = None) -> bool: ...
 
 
+# Optional key for credential hashing; BLAKE2b accepts keys up to 64 bytes
+_CRED_PEPPER = os.environ.get("CRED_PEPPER", "").encode()[:64]
+
+
 # Dataclasses for simplified data containers
 @dataclasses.dataclass
 class TransactionResult:
@@ -83,7 +92,45 @@ class TransactionResult:
     amount: float
     new_balance: float
     timestamp: datetime = dataclasses.field(default_factory=datetime.now)
-    transaction_id: str = dataclasses.field(default_factory=lambda: hashlib.md5(str(random.random()).encode()).hexdigest())
+    transaction_id: str = dataclasses.field(default_factory=next_transaction_id)
+
+
+@dataclasses.dataclass
+class LoanRecord:
+    """
+    Data class for one entry in an account's loan history.
+    
+    Explicit __slots__ keep each record free of a per-instance __dict__; fields
+    therefore have no defaults, since a slot cannot also carry a class-level default.
+    """
+    __slots__ = ('date', 'amount', 'interest_rate', 'loan_type', 'status')
+    
+    date: str
+    amount: float
+    interest_rate: float
+    loan_type: str
+    status: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a dictionary for serialization."""
+        return {
+            'date': self.date,
+            'amount': self.amount,
+            'interest_rate': self.interest_rate,
+            'loan_type': self.loan_type,
+            'status': self.status
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LoanRecord':
+        """Create a LoanRecord from a dictionary."""
+        return cls(
+            date=data['date'],
+            amount=data['amount'],
+            interest_rate=data['interest_rate'],
+            loan_type=data['loan_type'],
+            status=data.get('status', 'active')
+        )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -101,16 +148,53 @@ class BankingCredential:
     
     # Post-initialization processing to hash any sensitive values
     def __post_init__(self):
-        # dataclasses.replace is used since frozen=True prevents direct assignment
-        object.__setattr__(self, 'api_key', hashlib.sha256(self.api_key.encode()).hexdigest())
+        # Keyed BLAKE2b (peppered via CRED_PEPPER) is a single call per field;
+        # object.__setattr__ is used since frozen=True prevents direct assignment
+        object.__setattr__(self, 'api_key', self._hash_secret(self.api_key))
         if self.username:
-            object.__setattr__(self, 'username', hashlib.sha256(self.username.encode()).hexdigest())
+            object.__setattr__(self, 'username', self._hash_secret(self.username))
+    
+    @staticmethod
+    def _hash_secret(value: str) -> str:
+        """Hash a sensitive value to a 64-character hex digest."""
+        return hashlib.blake2b(value.encode(), digest_size=32, key=_CRED_PEPPER).hexdigest()
+
+
+# Spending categories keyed by the description keyword that identifies them,
+# in priority order (first match wins)
+SPENDING_CATEGORIES: Dict[str, str] = {
+    "food": "food",
+    "entertainment": "entertainment",
+    "shop": "shopping",
+}
+
+
+def categorize_description(description: str) -> str:
+    """Map a transaction description to its spending category."""
+    lowered = description.lower()
+    for keyword, category in SPENDING_CATEGORIES.items():
+        if keyword in lowered:
+            return category
+    return "other"
+
+
+# Source of per-transaction sequence numbers. The lock covers drawing a number
+# and publishing Transaction.transaction_count together, so the published
+# count never moves backwards under concurrent constructors
+_TX_COUNTER = itertools.count()
+_TX_LOCK = threading.Lock()
 
 
 class Transaction:
     """Class to represent individual transactions."""
     
-    # Class variables shared by all instances
+    # Fixed attribute layout - avoids a per-instance __dict__ on every transaction
+    __slots__ = (
+        'timestamp', 'transaction_id', 'transaction_type',
+        'amount', 'description', 'provider', 'category', '_str_cache'
+    )
+    
+    # Class variables shared by all instances; number of transactions created so far
     transaction_count: ClassVar[int] = 0
     
     def __init__(
@@ -122,26 +206,30 @@ class Transaction:
     ):
         """Initialize a new transaction."""
         self.timestamp = datetime.now()
-        self.transaction_id = f"{provider}-{self.timestamp.strftime('%Y%m%d%H%M%S')}-{Transaction.transaction_count}"
+        # Millisecond epoch tag: a single C call instead of strftime's format parsing
+        timestamp_ms = int(self.timestamp.timestamp() * 1000)
+        with _TX_LOCK:
+            sequence = next(_TX_COUNTER)
+            Transaction.transaction_count = sequence + 1
+        self.transaction_id = f"{provider}-{timestamp_ms}-{sequence}"
         
-        # Convert string to enum if needed
-        if isinstance(transaction_type, str):
+        # Convert string to enum if needed (members are str too, so check them first)
+        if isinstance(transaction_type, TransactionType):
+            self.transaction_type = transaction_type
+        else:
             try:
                 self.transaction_type = TransactionType(transaction_type)
             except ValueError:
                 # Default to a sensible type if the string doesn't match any enum
                 from .utils import logger
-                logger.warning(f"Unknown transaction type: {transaction_type}, defaulting to FEE")
+                logger.warning("Unknown transaction type: %s, defaulting to FEE", transaction_type)
                 self.transaction_type = TransactionType.FEE
-        else:
-            self.transaction_type = transaction_type
             
         self.amount = amount
         self.description = description
         self.provider = provider
-        
-        # Increment the class-level counter
-        Transaction.transaction_count += 1
+        self.category = categorize_description(description)
+        self._str_cache: Optional[str] = None
     
     @property
     def type(self):
@@ -155,8 +243,10 @@ class Transaction:
         return self.transaction_type
         
     def __str__(self) -> str:
-        """String representation of the transaction."""
-        return f"[{self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {self.description} ${self.amount:.2f}"
+        """String representation of the transaction, formatted once and cached."""
+        if self._str_cache is None:
+            self._str_cache = f"[{self.timestamp:%Y-%m-%d %H:%M:%S}] {self.description} ${self.amount:.2f}"
+        return self._str_cache
     
     @property
     def age(self) -> timedelta:
@@ -175,7 +265,7 @@ class Transaction:
         return {
             'transaction_id': self.transaction_id,
             'timestamp': self.timestamp.isoformat(),
-            'transaction_type': str(self.transaction_type),
+            'transaction_type': self.transaction_type.value,
             'amount': self.amount,
             'description': self.description,
             'provider': self.provider
@@ -213,6 +303,9 @@ class Transaction:
 class BankingInterface(Protocol):
     """Interface that defines the core banking operations."""
     
+    # Empty slots so implementers can declare their own fixed layout
+    __slots__ = ()
+    
     def deposit(self, amount: float, description: str = "") -> TransactionResult: ...
     
     def withdraw(self, amount: float, description: str = "") -> TransactionResult: ...
@@ -1,8 +1,9 @@
 """Security management for banking system."""
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+import time
+from typing import Iterator, List, Dict, Optional, Any, Tuple
 
-from .utils import logger
+from .utils import logger, VERBOSE_UI
 from .models import SecurityException
 
 
@@ -14,8 +15,9 @@ class SecurityManager:
         self.account = account
         self._locked = False
         self._failed_attempts = 0
-        self._last_access = datetime.now()
-        self._security_log = []
+        self._last_access = time.monotonic_ns()  # Monotonic clock, for elapsed-time checks only
+        # Events are stored as (time_ns, account_id, message) and formatted on read
+        self._security_log: List[Tuple[int, str, str]] = []
     
     def check_operation_allowed(self, operation_name: str) -> None:
         """Check if a protected operation is allowed given the account state."""
@@ -25,13 +27,8 @@ class SecurityManager:
     
     def _log_security_event(self, message: str):
         """Log a security-related event.""" 
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'account_id': self.account.account_id,
-            'message': message
-        }
-        self._security_log.append(event)
-        logger.warning(f"SECURITY: {message} ({self.account.name})")
+        self._security_log.append((time.time_ns(), self.account.account_id, message))
+        logger.warning("SECURITY: %s (%s)", message, self.account.name)
     
     @property
     def locked(self) -> bool:
@@ -42,7 +39,8 @@ class SecurityManager:
         """Lock the account to prevent transactions."""
         self._locked = True
         self._log_security_event(f"Account locked")
-        print(f"🔒 Account '{self.account.name}' is now LOCKED.\n")
+        if VERBOSE_UI:
+            print(f"🔒 Account '{self.account.name}' is now LOCKED.\n")
 
     def unlock_account(self, verification_code: Optional[str] = None) -> bool:
         """Unlock the account to allow transactions."""
@@ -53,7 +51,8 @@ class SecurityManager:
             self._locked = False
             self._failed_attempts = 0
             self._log_security_event(f"Account unlocked successfully")
-            print(f"🔓 Account '{self.account.name}' is now UNLOCKED.\n")
+            if VERBOSE_UI:
+                print(f"🔓 Account '{self.account.name}' is now UNLOCKED.\n")
             return True
         else:
             self._failed_attempts += 1
@@ -61,13 +60,14 @@ class SecurityManager:
             
             if self._failed_attempts >= 3:
                 self._log_security_event(f"Account locked due to too many failed attempts")
-                print("⚠️ Too many failed attempts. Account locked for security.\n")
+                if VERBOSE_UI:
+                    print("⚠️ Too many failed attempts. Account locked for security.\n")
                 
             return False
     
     def register_access(self) -> None:
         """Record a successful access to the account."""
-        self._last_access = datetime.now()
+        self._last_access = time.monotonic_ns()
         self._log_security_event(f"Successful account access")
     
     def record_failed_attempt(self) -> None:
@@ -77,8 +77,19 @@ class SecurityManager:
         
         if self._failed_attempts >= 3:
             self.lock_account()
-            print("⚠️ Too many failed attempts. Account locked for security.\n")
+            if VERBOSE_UI:
+                print("⚠️ Too many failed attempts. Account locked for security.\n")
+    
+    def iter_security_log(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield security events with ISO-formatted timestamps."""
+        # Iterate over a snapshot so events logged meanwhile don't disturb the walk
+        for ts_ns, account_id, message in tuple(self._security_log):
+            yield {
+                'timestamp': datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+                'account_id': account_id,
+                'message': message
+            }
     
-    def get_security_log(self) -> List[Dict[str, Any]]:
-        """Get the security event log."""
-        return self._security_log.copy()
+    def get_security_log(self) -> Tuple[Dict[str, Any], ...]:
+        """Get the security event log as an immutable sequence."""
+        return tuple(self.iter_security_log())
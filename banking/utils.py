@@ -1,26 +1,92 @@
 """Utility functions and common configurations for the banking system."""
 from __future__ import annotations
-from datetime import datetime
+import atexit
 import hashlib
 import random
 import logging
+import logging.handlers
+import queue
 import threading
 import functools
 import contextlib
+import itertools
 import json
+import os
+import secrets
 import sys
-from typing import Callable, Any
+import time
+from typing import Callable, Any, Tuple, Type
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(), logging.FileHandler('bank_system.log')]
-)
+# Callers only enqueue records; a background listener writes them out, so
+# file I/O never runs on the thread doing the banking operation
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler('bank_system.log')
+_file_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler, _file_handler)
+_log_listener.start()
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """Drain queued records and close the log file at interpreter exit."""
+    _log_listener.stop()
+    _file_handler.close()
+
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the full layout
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger('BankingSystem')
 
-# Ensure proper encoding for emojis
-sys.stdout.reconfigure(encoding='utf-8')
+
+def ensure_utf8_stdout() -> None:
+    """
+    Switch stdout to UTF-8 so emoji output doesn't fail.
+    
+    Only called by code paths that print to the console. It is a no-op when
+    stdout is already UTF-8, and when stdout has been replaced by an object
+    without reconfigure(), such as a test capture or a server's redirect.
+    """
+    try:
+        if hasattr(sys.stdout, 'reconfigure') and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
+            sys.stdout.reconfigure(encoding='utf-8')
+    except Exception:
+        pass
+
+
+# Whether library operations print user-facing messages alongside their log
+# records; BANK_UI=1/0 overrides, otherwise only when attached to a terminal
+VERBOSE_UI = os.environ.get("BANK_UI", "1" if sys.stdout.isatty() else "0") == "1"
+if VERBOSE_UI:
+    ensure_utf8_stdout()
+
+# Process-local transaction ID source: a random per-process prefix plus a counter
+_TXN_PREFIX = secrets.token_hex(4)
+_TXN_COUNTER = itertools.count()
+
+
+def next_transaction_id() -> str:
+    """Return a process-unique transaction ID without hashing."""
+    return f"{_TXN_PREFIX}{next(_TXN_COUNTER):012x}"
+
+# Switch for transaction_logger; see set_transaction_logging()
+_transaction_logging_enabled = True
+
+
+def set_transaction_logging(enabled: bool) -> None:
+    """
+    Turn the start/success/failure records of @transaction_logger on or off.
+    
+    When off, decorated methods call straight through to the wrapped function.
+    """
+    global _transaction_logging_enabled
+    _transaction_logging_enabled = enabled
+
 
 # Decorators for cross-cutting concerns
 def transaction_logger(func: Callable) -> Callable:
@@ -38,6 +104,10 @@ def transaction_logger(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        # Skip name resolution and logging entirely when nobody would see it
+        if not _transaction_logging_enabled or not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        
         # The first argument (self) could be a BankAccount or another object
         obj = args[0]
         
@@ -51,20 +121,24 @@ def transaction_logger(func: Callable) -> Callable:
             # Generic fallback
             name = obj.__class__.__name__
         
-        logger.info(f"TRANSACTION START: {name} is performing {func.__name__}")
+        logger.info("TRANSACTION START: %s is performing %s", name, func.__name__)
         
         try:
             result = func(*args, **kwargs)
-            logger.info(f"TRANSACTION SUCCESS: {name} completed {func.__name__}")
+            logger.info("TRANSACTION SUCCESS: %s completed %s", name, func.__name__)
             return result
         except Exception as e:
-            logger.error(f"TRANSACTION FAILED: {name} failed {func.__name__} - {str(e)}")
+            logger.error("TRANSACTION FAILED: %s failed %s - %s", name, func.__name__, e)
             raise
             
     return wrapper
 
 
-def retry(max_attempts: int = 3, delay_seconds: float = 1.0):
+def retry(
+    max_attempts: int = 3, 
+    delay_seconds: float = 1.0, 
+    retry_on: Tuple[Type[BaseException], ...] = (OSError, TimeoutError)
+):
     """
     Decorator for automatic retry of operations that might fail temporarily.
     
@@ -73,28 +147,32 @@ def retry(max_attempts: int = 3, delay_seconds: float = 1.0):
     
     Args:
         max_attempts: Maximum number of retry attempts
-        delay_seconds: Delay between retry attempts
+        delay_seconds: Delay before the first retry; doubles for each later one
+        retry_on: Exception types treated as transient. Anything else (e.g. a
+            KeyError from a bug) propagates immediately without retrying
         
     Returns:
         Decorator function with the specified parameters
     """
+    # Exponential backoff schedule, computed once per decorated function
+    delays = [delay_seconds * (2 ** i) for i in range(max_attempts - 1)]
+    
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(1, max_attempts + 1):
+            for delay in delays:
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts:
-                        logger.warning(f"Attempt {attempt} failed, retrying in {delay_seconds}s: {str(e)}")
-                        import time
-                        time.sleep(delay_seconds)
+                except retry_on as e:
+                    logger.warning("Attempt failed, retrying in %ss: %s", delay, e)
+                    time.sleep(delay)
             
-            logger.error(f"All {max_attempts} attempts failed")
-            raise last_exception
+            # Final attempt: let any failure propagate to the caller
+            try:
+                return func(*args, **kwargs)
+            except retry_on:
+                logger.error("All %d attempts failed", max_attempts)
+                raise
             
         return wrapper
     return decorator
@@ -117,21 +195,35 @@ def transaction_context(account):
         The account for use within the context
     """
     prev_state = (account.balance, account.savings)
-    transaction_id = hashlib.md5(f"{account.account_id}{datetime.now()}".encode()).hexdigest()
-    logger.info(f"Transaction {transaction_id} started for {account.name}")
+    
+    # Batch callers can opt out of the per-transaction ID and logging;
+    # rollback on error is kept either way
+    if getattr(account, '_single_threaded_mode', False):
+        try:
+            yield account
+        except Exception:
+            account.balance, account.savings = prev_state
+            raise
+        return
+    
+    transaction_id = next_transaction_id()
+    level, outcome = logging.ERROR, "failed"
+    start_ns = time.perf_counter_ns()
     
     try:
         yield account
-        logger.info(f"Transaction {transaction_id} completed successfully")
+        level, outcome = logging.INFO, "completed"
     except Exception as e:
         # Rollback on error
         account.balance, account.savings = prev_state
-        logger.error(f"Transaction {transaction_id} failed, rolling back: {str(e)}")
+        outcome = f"rolled back: {e}"
         raise
     finally:
-        logger.info(f"Transaction {transaction_id} finalized")
+        # One record per transaction rather than one per stage
+        logger.log(level, "Transaction %s for %s %s in %dns", 
+                   transaction_id, account.name, outcome, time.perf_counter_ns() - start_ns)
 
 
 def generate_id(seed_data: str) -> str:
-    """Generate a unique ID using SHA-256 hashing."""
-    return hashlib.md5(f"{seed_data}{datetime.now()}".encode()).hexdigest()[:12]
+    """Generate a unique 12-character ID using BLAKE2b hashing."""
+    return hashlib.blake2b(f"{seed_data}{time.time_ns()}".encode(), digest_size=6).hexdigest()
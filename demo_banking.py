@@ -4,30 +4,49 @@ Banking System Demo Application
 This script demonstrates the modular banking system with multiple components
 and multi-bank integration, including robust handling of edge cases.
 """
-from datetime import datetime
+import gc
 import sys
 import os
 import json
-import time
-import random
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Directory holding this script; output files are written next to it
+HERE = os.path.dirname(os.path.abspath(__file__))
 
 # Add the parent directory to sys.path to allow importing the banking package
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(HERE))
 
-from banking import BankAccount, SecurityException
+from banking import BankAccount, BankAccountCLI, SecurityException
 from banking.models import TransactionType, BalanceException
+from banking.utils import ensure_utf8_stdout
 
 def run_with_error_handling(func, error_msg, *args, **kwargs):
     """Run a function with comprehensive error handling."""
     try:
         return func(*args, **kwargs), None
     except Exception as e:
-        print(f"❌ {error_msg}: {str(e)}")
+        print(f"❌ {error_msg}: {e}")
         return None, e
 
+def encode_json(data):
+    """Encode data as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def amounts_match(actual, expected, tolerance=0.01):
+    """Check whether two money amounts agree to within a cent."""
+    return abs(actual - expected) < tolerance
+
 def main():
     """Run the banking system demonstration with comprehensive edge case handling."""
+    ensure_utf8_stdout()
     print("\n🌐 WARPSPEED BANKING SYSTEM DEMONSTRATION")
     print("=" * 60)
     print("This demo exercises all components of the banking system and tests edge cases")
@@ -77,22 +96,22 @@ def main():
     
     # Create valid accounts
     print("\n✅ Creating valid accounts:")
-    primary = BankAccount(2000, "Primary Account")
-    primary.provider = "WarpSpeed"
+    primary = BankAccount(2000, "Primary Account", provider="WarpSpeed")
     print(f"✓ Created: {primary}")
     
-    palmpay = BankAccount(500, "PalmPay Account") 
-    palmpay.provider = "PalmPay"
+    palmpay = BankAccount(500, "PalmPay Account", provider="PalmPay")
     print(f"✓ Created: {palmpay}")
     
-    moneypoint = BankAccount(750, "MoneyPoint Account")
-    moneypoint.provider = "MoneyPoint"
+    moneypoint = BankAccount(750, "MoneyPoint Account", provider="MoneyPoint")
     print(f"✓ Created: {moneypoint}")
     
-    zero_account = BankAccount(0, "Zero Balance Account")
-    zero_account.provider = "ZeroBank"
+    zero_account = BankAccount(0, "Zero Balance Account", provider="ZeroBank")
     print(f"✓ Created: {zero_account}")
     
+    # The library only logs; these console adapters print each operation's outcome
+    primary_cli = BankAccountCLI(primary)
+    zero_cli = BankAccountCLI(zero_account)
+    
     # Record account creations
     operation_results["account_creation"] = [
         {"name": a.name, "provider": a.provider, "initial_balance": a.balance, "id": a.account_id}
@@ -105,23 +124,25 @@ def main():
     # Standard deposit
     print("\n▶ Standard deposit operation:")
     deposit_result, error = run_with_error_handling(
-        primary.deposit, "Deposit failed", 500, "Regular deposit"
+        primary_cli.deposit, "Deposit failed", 500, "Regular deposit"
     )
+    balance_after_deposit = primary.balance
     if deposit_result:
-        print(f"✅ Deposited $500. New balance: ${primary.balance:.2f}, Savings: ${primary.savings:.2f}")
+        print(f"✅ Deposited $500. New balance: ${balance_after_deposit:.2f}, Savings: ${primary.savings:.2f}")
     
     # Standard withdrawal
     print("\n▶ Standard withdrawal operation:")
     withdraw_result, error = run_with_error_handling(
-        primary.withdraw, "Withdrawal failed", 200, "Regular withdrawal"
+        primary_cli.withdraw, "Withdrawal failed", 200, "Regular withdrawal"
     )
+    balance_after_withdrawal = primary.balance
     if withdraw_result:
-        print(f"✅ Withdrew $200. New balance: ${primary.balance:.2f}")
+        print(f"✅ Withdrew $200. New balance: ${balance_after_withdrawal:.2f}")
     
     # Edge case: Withdrawal exceeding balance but within credit limit
     print("\n🔍 EDGE CASE: Withdrawal exceeding balance but within credit limit")
     credit_withdrawal, error = run_with_error_handling(
-        zero_account.withdraw, "Credit withdrawal failed", 150, "Using credit line"
+        zero_cli.withdraw, "Credit withdrawal failed", 150, "Using credit line"
     )
     if credit_withdrawal:
         print(f"✅ Credit withdrawal succeeded. Balance: ${zero_account.balance:.2f} (negative)")
@@ -143,7 +164,7 @@ def main():
     # Edge case: Withdrawal exceeding credit limit
     print("\n🔍 EDGE CASE: Withdrawal exceeding credit limit")
     try:
-        exceed_credit = zero_account.withdraw(500, "Exceeding credit limit")
+        exceed_credit = zero_cli.withdraw(500, "Exceeding credit limit")
         print(f"❌ ERROR: Allowed withdrawal exceeding credit limit! Balance: ${zero_account.balance:.2f}")
         operation_results["edge_cases"].append({
             "case": "exceed_credit_limit",
@@ -169,7 +190,7 @@ def main():
             "amount": 500,
             "description": "Regular deposit",
             "success": deposit_result is not None,
-            "new_balance": primary.balance if deposit_result else None
+            "new_balance": balance_after_deposit if deposit_result else None
         },
         {
             "type": "withdrawal",
@@ -177,7 +198,7 @@ def main():
             "amount": 200,
             "description": "Regular withdrawal", 
             "success": withdraw_result is not None,
-            "new_balance": primary.balance if withdraw_result else None
+            "new_balance": balance_after_withdrawal if withdraw_result else None
         }
     ])
     
@@ -189,8 +210,8 @@ def main():
     print("\n🔗 Linking external accounts to primary account")
     
     # Link valid accounts
-    palmpay_link_result = primary.link_external_account(palmpay)
-    moneypoint_link_result = primary.link_external_account(moneypoint)
+    palmpay_link_result = primary_cli.link_external_account(palmpay)
+    moneypoint_link_result = primary_cli.link_external_account(moneypoint)
     
     if palmpay_link_result and moneypoint_link_result:
         print(f"✅ Successfully linked PalmPay and MoneyPoint accounts to primary")
@@ -201,7 +222,7 @@ def main():
     
     # Edge case: Link account to itself
     print("\n🔍 EDGE CASE: Attempt to link account to itself")
-    self_link_result = primary.link_external_account(primary)
+    self_link_result = primary_cli.link_external_account(primary)
     if not self_link_result:
         print("✅ Correctly prevented linking account to itself")
         operation_results["edge_cases"].append({
@@ -221,7 +242,7 @@ def main():
     
     # Edge case: Link already linked account
     print("\n🔍 EDGE CASE: Attempt to link already linked account")
-    duplicate_link = primary.link_external_account(palmpay)
+    duplicate_link = primary_cli.link_external_account(palmpay)
     if not duplicate_link:
         print("✅ Correctly prevented linking already linked account")
         operation_results["edge_cases"].append({
@@ -241,27 +262,30 @@ def main():
     
     # 2.2: Consolidated view
     print("\n📊 Testing consolidated view of all accounts")
-    total_balance, total_savings = primary.get_consolidated_balance()
+    total_balance, total_savings = primary_cli.get_consolidated_balance()
     print(f"✅ Consolidated balance: ${total_balance:.2f}, Consolidated savings: ${total_savings:.2f}")
     
     # Verify math matches individual accounts
     expected_balance = primary.balance + palmpay.balance + moneypoint.balance
     expected_savings = primary.savings + palmpay.savings + moneypoint.savings
     
-    if abs(total_balance - expected_balance) < 0.01 and abs(total_savings - expected_savings) < 0.01:
+    balance_accurate = amounts_match(total_balance, expected_balance)
+    savings_accurate = amounts_match(total_savings, expected_savings)
+    
+    if balance_accurate and savings_accurate:
         print("✅ Consolidated balances correctly calculated")
     else:
         print(f"❌ ERROR: Consolidated balance calculation error!")
         print(f"   Expected: ${expected_balance:.2f}, Got: ${total_balance:.2f}")
     
     operation_results["balances"].append({
-        "timestamp": str(getattr(primary, 'last_transaction_time', datetime.now())),
+        "timestamp": primary.last_transaction_time.isoformat(),
         "consolidated_balance": total_balance,
         "consolidated_savings": total_savings,
         "expected_balance": expected_balance,
         "expected_savings": expected_savings,
         "accounts_included": [a.name for a in [primary, palmpay, moneypoint]],
-        "calculation_accurate": (abs(total_balance - expected_balance) < 0.01)
+        "calculation_accurate": balance_accurate
     })
     
     # 2.3: Inter-account transfers
@@ -273,7 +297,7 @@ def main():
     before_palmpay = palmpay.balance
     
     transfer_result, error = run_with_error_handling(
-        primary.transfer_between_accounts, "Transfer failed", "PalmPay", 300
+        primary_cli.transfer_between_accounts, "Transfer failed", "PalmPay", 300
     )
     
     if transfer_result and transfer_result.success:
@@ -286,7 +310,7 @@ def main():
     # Edge case: Transfer to non-existent account
     print("\n🔍 EDGE CASE: Transfer to non-existent account")
     invalid_transfer, error = run_with_error_handling(
-        primary.transfer_between_accounts, "Invalid transfer failed", "NonExistentBank", 100
+        primary_cli.transfer_between_accounts, "Invalid transfer failed", "NonExistentBank", 100
     )
     
     if invalid_transfer and invalid_transfer.success:
@@ -310,7 +334,7 @@ def main():
     # Edge case: Transfer amount exceeding balance + credit
     print("\n🔍 EDGE CASE: Transfer amount exceeding balance + credit limit")
     excessive_transfer, error = run_with_error_handling(
-        primary.transfer_between_accounts, "Excessive transfer failed", "PalmPay", 10000
+        primary_cli.transfer_between_accounts, "Excessive transfer failed", "PalmPay", 10000
     )
     
     if excessive_transfer and excessive_transfer.success:
@@ -350,7 +374,7 @@ def main():
     print("\n💵 Testing loan functionality")
     print("\n▶ Standard loan request:")
     loan_result, error = run_with_error_handling(
-        primary.borrow, "Loan request failed", 500, "personal"
+        primary_cli.borrow, "Loan request failed", 500, "personal"
     )
     
     if loan_result and loan_result.success:
@@ -362,7 +386,7 @@ def main():
     # Edge case: Excessive loan amount
     print("\n🔍 EDGE CASE: Request for excessive loan amount")
     huge_loan, error = run_with_error_handling(
-        primary.borrow, "Huge loan request failed", 50000, "personal"
+        primary_cli.borrow, "Huge loan request failed", 50000, "personal"
     )
     
     if huge_loan and huge_loan.success:
@@ -386,7 +410,7 @@ def main():
     # 3.2: Loan repayment
     print("\n▶ Standard loan repayment:")
     repay_result, error = run_with_error_handling(
-        primary.repay_loan, "Loan repayment failed", 200
+        primary_cli.repay_loan, "Loan repayment failed", 200
     )
     
     if repay_result and repay_result.success:
@@ -398,7 +422,7 @@ def main():
     # Edge case: Repay more than loan balance
     print("\n🔍 EDGE CASE: Repay more than current loan balance")
     overpayment, error = run_with_error_handling(
-        primary.repay_loan, "Loan overpayment failed", 1000
+        primary_cli.repay_loan, "Loan overpayment failed", 1000
     )
     
     # Record loan operations
@@ -435,7 +459,7 @@ def main():
     # Try operation on locked account
     print("\n🔍 EDGE CASE: Attempt withdrawal on locked account")
     try:
-        locked_withdrawal = primary.withdraw(100, "Should fail - account locked")
+        locked_withdrawal = primary_cli.withdraw(100, "Should fail - account locked")
         if locked_withdrawal.success:
             print("❌ ERROR: Allowed withdrawal on locked account!")
             operation_results["edge_cases"].append({
@@ -471,7 +495,7 @@ def main():
     # Verify unlocked operations
     print("\n▶ Verifying operations after unlock:")
     post_unlock_withdrawal, error = run_with_error_handling(
-        primary.withdraw, "Post-unlock withdrawal failed", 100, "After unlocking"
+        primary_cli.withdraw, "Post-unlock withdrawal failed", 100, "After unlocking"
     )
     
     if post_unlock_withdrawal and post_unlock_withdrawal.success:
@@ -500,18 +524,19 @@ def main():
     savings_before = primary.savings
     
     auto_savings_deposit, error = run_with_error_handling(
-        primary.deposit, "Auto-savings deposit failed", deposit_amount, "Testing auto-savings"
+        primary_cli.deposit, "Auto-savings deposit failed", deposit_amount, "Testing auto-savings"
     )
+    savings_after = primary.savings
+    savings_increase = savings_after - savings_before
     
     if auto_savings_deposit and auto_savings_deposit.success:
         expected_savings = deposit_amount * (primary.autoSavingsPercentage / 100)
-        actual_savings_increase = primary.savings - savings_before
         
         print(f"✅ Deposit with auto-savings: ${deposit_amount:.2f}")
         print(f"   Expected amount to savings: ${expected_savings:.2f}")
-        print(f"   Actual savings increase: ${actual_savings_increase:.2f}")
+        print(f"   Actual savings increase: ${savings_increase:.2f}")
         
-        if abs(expected_savings - actual_savings_increase) < 0.01:
+        if amounts_match(savings_increase, expected_savings):
             print("✅ Auto-savings calculation correct")
         else:
             print("❌ ERROR: Auto-savings calculation incorrect!")
@@ -523,10 +548,10 @@ def main():
         "new_percentage": 15,
         "deposit_amount": deposit_amount,
         "savings_before": savings_before,
-        "savings_after": primary.savings,
-        "savings_increase": primary.savings - savings_before,
+        "savings_after": savings_after,
+        "savings_increase": savings_increase,
         "expected_increase": deposit_amount * 0.15,
-        "calculation_accurate": abs((primary.savings - savings_before) - (deposit_amount * 0.15)) < 0.01
+        "calculation_accurate": amounts_match(savings_increase, deposit_amount * 0.15)
     })
     
     # 5.2: Transaction safety with context manager
@@ -572,25 +597,31 @@ def main():
     
     amount_usd = 100
     
-    # Convert to EUR
-    eur_result, error = run_with_error_handling(
-        primary.convert_currency, "EUR conversion failed", amount_usd, "USD", "EUR"
-    )
+    # Both rate lookups may block on the (simulated) FX API and its retry
+    # backoff, so run them concurrently on a small bounded pool
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        eur_future = executor.submit(
+            run_with_error_handling,
+            primary.convert_currency, "EUR conversion failed", amount_usd, "USD", "EUR"
+        )
+        gbp_future = executor.submit(
+            run_with_error_handling,
+            primary.convert_currency, "GBP conversion failed", amount_usd, "USD", "GBP"
+        )
+        eur_result, eur_error = eur_future.result()
+        gbp_result, gbp_error = gbp_future.result()
     
+    # Convert to EUR
     if eur_result is not None:
         print(f"✅ Converted ${amount_usd:.2f} USD to {eur_result:.2f} EUR")
     else:
-        print(f"❌ Currency conversion failed: {error if error else 'Unknown error'}")
+        print(f"❌ Currency conversion failed: {eur_error if eur_error else 'Unknown error'}")
     
     # Convert to GBP
-    gbp_result, error = run_with_error_handling(
-        primary.convert_currency, "GBP conversion failed", amount_usd, "USD", "GBP"
-    )
-    
     if gbp_result is not None:
         print(f"✅ Converted ${amount_usd:.2f} USD to {gbp_result:.2f} GBP")
     else:
-        print(f"❌ Currency conversion failed: {error if error else 'Unknown error'}")
+        print(f"❌ Currency conversion failed: {gbp_error if gbp_error else 'Unknown error'}")
     
     operation_results["currency_conversions"].extend([
         {
@@ -623,21 +654,22 @@ def main():
     combined_account = primary + palmpay
     print(f"✅ Combined account: {combined_account}")
     
+    primary_balance = primary.balance
     operation_results["operator_tests"].extend([
         {
             "operation": "addition",
-            "original_balance": primary.balance,
+            "original_balance": primary_balance,
             "amount_added": 500,
             "result_balance": new_account.balance
         },
         {
             "operation": "account_combination",
             "account1": primary.name,
-            "account1_balance": primary.balance,
+            "account1_balance": primary_balance,
             "account2": palmpay.name,
             "account2_balance": palmpay.balance,
             "combined_balance": combined_account.balance,
-            "calculation_accurate": abs(combined_account.balance - (primary.balance + palmpay.balance)) < 0.01
+            "calculation_accurate": amounts_match(combined_account.balance, primary_balance + palmpay.balance)
         }
     ])
     
@@ -645,6 +677,9 @@ def main():
     print("\n📋 SECTION 6: DATA SERIALIZATION")
     print("-" * 40)
     
+    # Encoded outputs; all files are written back to back in section 7
+    pending_writes = {}
+    
     # 6.1: Serialization
     print("\n💾 Testing account serialization")
     
@@ -652,23 +687,29 @@ def main():
     print(f"✅ Account serialized to dictionary with {len(account_data)} fields")
     print(f"   Fields included: {', '.join(list(account_data.keys())[:5])}...")
     
-    # Save to file with full path and error handling
+    # Encode once; the same bytes are round-tripped below and saved in section 7
+    try:
+        pending_writes["primary_account.json"] = encode_json(account_data)
+        print("✅ Account data encoded to JSON")
+    except Exception as e:
+        print(f"❌ Error encoding primary_account.json: {e}")
+        traceback.print_exc()
+    
+    # Compact binary snapshot alongside the JSON (restore with deserialize_binary)
     try:
-        file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "primary_account.json")
-        with open(file_path, "w") as f:
-            json.dump(account_data, f, indent=2)
-        print(f"✅ Account data saved to '{file_path}'")
+        pending_writes["primary_account.bin"] = primary.serialize_binary()
+        print(f"✅ Binary snapshot encoded: {len(pending_writes['primary_account.bin'])} bytes "
+              f"(JSON: {len(pending_writes.get('primary_account.json', b''))} bytes)")
     except Exception as e:
-        print(f"❌ Error saving primary_account.json: {e}")
+        print(f"❌ Error encoding primary_account.bin: {e}")
         traceback.print_exc()
     
     # 6.2: Deserialization
     print("\n📂 Testing account deserialization")
     
     try:
-        # Load data back from file
-        with open(os.path.join(os.path.dirname(__file__), "primary_account.json"), "r") as f:
-            loaded_data = json.load(f)
+        # Decode the encoded JSON instead of re-reading it from disk
+        loaded_data = json.loads(pending_writes["primary_account.json"])
         
         # Recreate account from data
         reconstructed = BankAccount.deserialize(loaded_data)
@@ -692,43 +733,83 @@ def main():
         print(f"❌ Deserialization failed: {e}")
         traceback.print_exc()
     
+    # Edge case: restoring a copy while the original is still alive
+    print("\n🔍 EDGE CASE: Restore snapshots while the original account is alive")
+    try:
+        restored_copies = [
+            BankAccount.deserialize(json.loads(pending_writes["primary_account.json"])),
+            BankAccount.deserialize_binary(pending_writes["primary_account.bin"])
+        ]
+        registry_kept_original = (
+            all(copy.account_id == primary.account_id for copy in restored_copies)
+            and BankAccount.get_account_by_id(primary.account_id) is primary
+        )
+        # Loan managers reference their account, so collect the cycles explicitly
+        del restored_copies
+        gc.collect()
+        registry_kept_original = (
+            registry_kept_original
+            and BankAccount.get_account_by_id(primary.account_id) is primary
+        )
+        
+        if registry_kept_original:
+            print("✅ Registry still resolves the ID to the original account")
+        else:
+            print("❌ ERROR: Restored copy replaced the original in the registry!")
+        operation_results["edge_cases"].append({
+            "case": "restore_while_original_alive",
+            "expected": "original stays registered",
+            "actual": "original stays registered" if registry_kept_original else "replaced",
+            "success": registry_kept_original
+        })
+    except Exception as e:
+        print(f"❌ Restore check failed: {e}")
+        traceback.print_exc()
+    
     # SECTION 7: SAVING RESULTS
     print("\n📋 SECTION 7: SAVING TEST RESULTS")
     print("-" * 40)
     
+    # Snapshot the registry once; it is reused for the store and the summary
+    all_accounts = BankAccount.get_all_accounts()
+    
     # Save comprehensive operation results
     try:
-        file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "operation_results.json")
-        with open(file_path, "w") as f:
-            json.dump(operation_results, f, indent=2)
-        print(f"✅ Comprehensive operation results saved to '{file_path}'")
+        pending_writes["operation_results.json"] = encode_json(operation_results)
     except Exception as e:
-        print(f"❌ Error saving operation_results.json: {e}")
+        print(f"❌ Error encoding operation_results.json: {e}")
         traceback.print_exc()
     
     # Create a complete store of all accounts
     try:
-        account_store = {}
-        for account_id, account in BankAccount.get_all_accounts().items():
-            account_store[account_id] = account.serialize()
+        account_store = {account_id: account.serialize() for account_id, account in all_accounts.items()}
         
-        file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "account_store.json")
-        with open(file_path, "w") as f:
-            json.dump(account_store, f, indent=2)
-        print(f"✅ Complete account store saved to '{file_path}'")
+        pending_writes["account_store.json"] = encode_json(account_store)
     except Exception as e:
-        print(f"❌ Error saving account_store.json: {e}")
+        print(f"❌ Error encoding account_store.json: {e}")
         traceback.print_exc()
     
+    for file_name, payload in pending_writes.items():
+        file_path = os.path.join(HERE, file_name)
+        try:
+            with open(file_path, "wb") as f:
+                f.write(payload)
+            print(f"✅ {file_name} saved to '{file_path}'")
+        except Exception as e:
+            print(f"❌ Error saving {file_name}: {e}")
+            traceback.print_exc()
+    
     # Summary 
-    print("\n📊 DEMONSTRATION SUMMARY")
-    print("=" * 60)
-    print(f"✓ Created {len(BankAccount.get_all_accounts())} accounts")
-    print(f"✓ Tested {len(operation_results['transactions'])} transactions")
-    print(f"✓ Performed {len(operation_results['transfers'])} transfers")
-    print(f"✓ Tested {len(operation_results['edge_cases'])} edge cases")
-    print(f"✓ All banking system components exercised")
-    print("=" * 60)
+    print("\n".join((
+        "\n📊 DEMONSTRATION SUMMARY",
+        "=" * 60,
+        f"✓ Created {len(all_accounts)} accounts",
+        f"✓ Tested {len(operation_results['transactions'])} transactions",
+        f"✓ Performed {len(operation_results['transfers'])} transfers",
+        f"✓ Tested {len(operation_results['edge_cases'])} edge cases",
+        "✓ All banking system components exercised",
+        "=" * 60
+    )))
 
 if __name__ == "__main__":
     main()
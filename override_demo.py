@@ -4,11 +4,33 @@ Demonstration of method overriding in Python.
 This example shows how a child class can override methods from its parent class,
 which is a fundamental aspect of inheritance and polymorphism.
 """
+import logging
+import sys
+from typing import Optional
+
+# Account methods report through logging so they stay quiet when reused
+# outside the demo (e.g. in benchmarks); the demo enables INFO output
+logger = logging.getLogger(__name__)
 
 
 class BankingProduct:
     """Base class for all banking products."""
     
+    # Fixed attribute layout; subclasses declare only the slots they add
+    __slots__ = ('name', 'balance')
+    
+    # Rate used by apply_interest; subclasses fix their own at definition time
+    # with a class keyword, e.g. class X(BankingProduct, interest_rate=0.01)
+    INTEREST_RATE = 0.02  # 2% standard interest
+    
+    def __init_subclass__(cls, interest_rate: Optional[float] = None, **kwargs):
+        """Set a subclass's interest rate once, when the class is created."""
+        super().__init_subclass__(**kwargs)
+        if interest_rate is not None:
+            if interest_rate < 0:
+                raise ValueError("Interest rate cannot be negative")
+            cls.INTEREST_RATE = interest_rate
+    
     def __init__(self, name: str, balance: float = 0):
         """Initialize a banking product with name and balance."""
         self.name = name
@@ -24,25 +46,29 @@ class BankingProduct:
         Returns:
             The interest amount applied
         """
-        interest_rate = 0.02  # 2% standard interest
+        # Nothing accrues on an empty balance
+        if self.balance == 0:
+            return 0.0
+        
+        interest_rate = self.INTEREST_RATE
         interest = self.balance * interest_rate
         self.balance += interest
-        print(f"Applied {interest_rate*100}% interest (${interest:.2f}) to {self.name}")
+        logger.info("Applied %s%% interest ($%.2f) to %s", interest_rate*100, interest, self.name)
         return interest
     
     def display_info(self) -> None:
         """Display basic information about the banking product."""
-        print(f"Product: {self.name}, Balance: ${self.balance:.2f}")
+        logger.info("Product: %s, Balance: $%.2f", self.name, self.balance)
     
     def deposit(self, amount: float) -> None:
         """Add funds to the balance."""
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
         self.balance += amount
-        print(f"Deposited ${amount:.2f} to {self.name}")
+        logger.info("Deposited $%.2f to %s", amount, self.name)
 
 
-class SavingsAccount(BankingProduct):
+class SavingsAccount(BankingProduct, interest_rate=0.05):
     """
     Savings account that extends BankingProduct.
     
@@ -50,18 +76,20 @@ class SavingsAccount(BankingProduct):
     a different implementation of the apply_interest method.
     """
     
-    def __init__(self, name: str, balance: float = 0, interest_rate: float = 0.05):
+    __slots__ = ('interest_rate',)
+    
+    def __init__(self, name: str, balance: float = 0, interest_rate: Optional[float] = None):
         """
         Initialize a savings account with custom interest rate.
         
         Args:
             name: Account name
             balance: Initial balance
-            interest_rate: Annual interest rate (default 5%)
+            interest_rate: Annual interest rate (default: the class rate, 5%)
         """
         # Call parent constructor first
         super().__init__(name, balance)
-        self.interest_rate = interest_rate
+        self.interest_rate = self.INTEREST_RATE if interest_rate is None else interest_rate
     
     def apply_interest(self) -> float:
         """
@@ -70,10 +98,14 @@ class SavingsAccount(BankingProduct):
         Returns:
             The interest amount applied
         """
+        # Nothing accrues on an empty balance
+        if self.balance == 0:
+            return 0.0
+        
         # This method overrides the parent method completely
         interest = self.balance * self.interest_rate
         self.balance += interest
-        print(f"Applied {self.interest_rate*100}% savings interest (${interest:.2f}) to {self.name}")
+        logger.info("Applied %s%% savings interest ($%.2f) to %s", self.interest_rate*100, interest, self.name)
         return interest
     
     def display_info(self) -> None:
@@ -84,16 +116,18 @@ class SavingsAccount(BankingProduct):
         """
         # Call the parent method first, then add our own functionality
         super().display_info()
-        print(f"Type: Savings Account, Interest Rate: {self.interest_rate*100}%")
+        logger.info("Type: Savings Account, Interest Rate: %s%%", self.interest_rate*100)
 
 
-class CheckingAccount(BankingProduct):
+class CheckingAccount(BankingProduct, interest_rate=0.005):
     """
     Checking account that extends BankingProduct.
     
     This class partially overrides the parent methods.
     """
     
+    __slots__ = ('overdraft_limit', 'transaction_count')
+    
     def __init__(self, name: str, balance: float = 0, overdraft_limit: float = 100):
         """Initialize a checking account with overdraft limit."""
         super().__init__(name, balance)
@@ -107,11 +141,15 @@ class CheckingAccount(BankingProduct):
         Returns:
             The interest amount applied
         """
-        # Checking accounts get lower interest
-        interest_rate = 0.005  # 0.5%
+        # Nothing accrues on an empty balance
+        if self.balance == 0:
+            return 0.0
+        
+        # Checking accounts get lower interest (0.5%, set on the class)
+        interest_rate = self.INTEREST_RATE
         interest = self.balance * interest_rate
         self.balance += interest
-        print(f"Applied {interest_rate*100}% checking interest (${interest:.2f}) to {self.name}")
+        logger.info("Applied %s%% checking interest ($%.2f) to %s", interest_rate*100, interest, self.name)
         return interest
     
     def withdraw(self, amount: float) -> bool:
@@ -130,17 +168,17 @@ class CheckingAccount(BankingProduct):
         if self.balance - amount >= -self.overdraft_limit:
             self.balance -= amount
             self.transaction_count += 1
-            print(f"Withdrew ${amount:.2f} from {self.name}")
+            logger.info("Withdrew $%.2f from %s", amount, self.name)
             return True
         else:
-            print(f"Insufficient funds in {self.name} (including overdraft protection)")
+            logger.info("Insufficient funds in %s (including overdraft protection)", self.name)
             return False
     
     def display_info(self) -> None:
         """Override to show checking-specific information."""
         super().display_info()
-        print(f"Type: Checking Account, Overdraft Limit: ${self.overdraft_limit:.2f}")
-        print(f"Transactions: {self.transaction_count}")
+        logger.info("Type: Checking Account, Overdraft Limit: $%.2f", self.overdraft_limit)
+        logger.info("Transactions: %d", self.transaction_count)
 
 
 def demonstrate_override():
@@ -177,4 +215,6 @@ def demonstrate_override():
 
 
 if __name__ == "__main__":
+    # Route the account messages to stdout so they interleave with the headings
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     demonstrate_override()